@@ -1,13 +1,235 @@
-import os
-import sys
 import tkinter as tk
 from tkinter import Canvas, PhotoImage
-from PIL import Image, ImageTk
+import tkinter.font as tkFont
 from pathlib import Path
-import math
+import textwrap
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache, partial
+
+# Rotated PhotoImages shared by every scene setup, keyed on (path, rotated, overlays).
+# Holding them here also keeps a strong reference so Tk doesn't GC them.
+_ROTATED_IMG_CACHE = {}
+_ROTATED_IMG_MASTER = None  # Tk root the cached images were created for
+
+# Tk root shared by every scene, created by the first scene set up without a master
+_shared_root = None
+# Canvas shared by every scene on that root, scenes keep their items under their own tag
+_shared_canvas = None
+
+# Unrotated canvas size the scene layouts are designed for
+CANVAS_SIZE = (720, 1080)
+
+# Scene image paths, built once at import rather than on every scene setup
+_ASSETS = Path(__file__).parent / "assets"
+_FRAME_PATHS = {k: _ASSETS / k / "image_1.png" for k in ("frame0", "frame1", "frame2")}
+
+
+@dataclass(frozen=True)
+class SceneSpec:
+    """Per-scene layout: asset folder, unrotated image/title y and an optional
+    (width, height, top) rectangle composited behind the image"""
+    assets: str
+    image_y: float
+    text_y: float
+    rect: tuple = None
+
+# (family, size) -> pixel-size font tuple reused by show_text
+_FONT_TUPLE_CACHE = {}
+
+# Named Tk fonts shared by every scene, keyed on (family, size)
+_FONT_CACHE = {}
+_FONT_MASTER = None  # Tk root the cached fonts were created for
+
+# Font sizes used by the scenes and main app, resolved by Tk when a scene is set up
+PRELOAD_FONT_SIZES = (24, 25, 30, 40, 50, 70)
+
+# Latin, Cyrillic and punctuation glyphs transcriptions are drawn with
+PRELOAD_GLYPHS = (
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    "АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯабвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+    " .,!?:;'\"-()"
+)
+
+
+def _get_font(master, family, size):
+    """Return the shared named Tk font for (family, size), created and warmed once per root"""
+    global _FONT_MASTER
+    # Fonts belong to one Tk interpreter, so start over when the root changes
+    if master is not _FONT_MASTER:
+        _FONT_CACHE.clear()
+        _FONT_MASTER = master
+    
+    font = _FONT_CACHE.get((family, size))
+    if font is None:
+        font = tkFont.Font(root=master, family=family, size=size)
+        # Measuring makes Tk load the glyphs and any fallback fonts now,
+        # rather than on the first transcription that uses them
+        font.measure(PRELOAD_GLYPHS)
+        _FONT_CACHE[(family, size)] = font
+    return font
+
+
+def _composite_overlays(pil_image, overlay_rects):
+    """Draw (x0, y0, x1, y1, color) rectangles behind an image
+    
+    Rectangle coordinates are relative to the image center. Returns the
+    composite and the offset of its center from the image center.
+    """
+    from PIL import Image, ImageDraw
+    
+    w, h = pil_image.size
+    left = min([-w / 2] + [r[0] for r in overlay_rects])
+    top = min([-h / 2] + [r[1] for r in overlay_rects])
+    right = max([w / 2] + [r[2] for r in overlay_rects])
+    bottom = max([h / 2] + [r[3] for r in overlay_rects])
+    
+    composite = Image.new("RGBA", (round(right - left), round(bottom - top)), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(composite)
+    for x0, y0, x1, y1, color in overlay_rects:
+        # PIL rectangles include their far edge, Tk's do not
+        draw.rectangle((x0 - left, y0 - top, x1 - left - 1, y1 - top - 1), fill=color)
+    composite.alpha_composite(pil_image.convert("RGBA"), (round(-w / 2 - left), round(-h / 2 - top)))
+    return composite, ((left + right) / 2, (top + bottom) / 2)
+
+
+def fit_canvas(pil_image, rotated):
+    """Downscale an image once so it's no larger than the canvas it's drawn on"""
+    from PIL import Image
+    
+    width, height = CANVAS_SIZE
+    bounds = (height, width) if rotated else (width, height)
+    if pil_image.width > bounds[0] or pil_image.height > bounds[1]:
+        pil_image = pil_image.copy()
+        pil_image.thumbnail(bounds, Image.LANCZOS)
+    return pil_image
+
+
+def _load_rotated_photo(path, rotated, master, overlay_rects=()):
+    """Load an image as a PhotoImage, rotated 90 degrees left if requested
+    
+    Returns (PhotoImage, (dx, dy)), where (dx, dy) shifts the image center
+    when overlay rectangles extend the image.
+    """
+    global _ROTATED_IMG_MASTER
+    # PhotoImages belong to one Tk interpreter, so start over when the root changes
+    if master is not _ROTATED_IMG_MASTER:
+        _ROTATED_IMG_CACHE.clear()
+        _ROTATED_IMG_MASTER = master
+    
+    key = (str(path), rotated, overlay_rects)
+    cached = _ROTATED_IMG_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    path = Path(path)
+    if not overlay_rects:
+        # prerotate_assets.py writes the scene images as PPMs, already
+        # flattened onto black and fit to the canvas. Tk reads PPM with a plain
+        # copy, so these never need PIL or a zlib decode
+        ppm_path = path.with_name(path.stem + ("_rot" if rotated else "") + ".ppm")
+        try:
+            # A PNG edited since the last build wins over its stale PPM
+            fresh = ppm_path.stat().st_mtime >= path.stat().st_mtime
+        except OSError:
+            fresh = False
+        if fresh:
+            cached = (PhotoImage(master=master, file=str(ppm_path)), (0, 0))
+            _ROTATED_IMG_CACHE[key] = cached
+            return cached
+    
+    # PIL is only imported once an asset needs compositing or has no fresh PPM
+    from PIL import Image, ImageTk
+    
+    pil_image = Image.open(str(path))
+    offset = (0, 0)
+    if rotated:
+        # Exact 90 degree turn via transpose, no resampling needed
+        pil_image = pil_image.transpose(Image.ROTATE_90)  # Rotate 90 degrees left
+    pil_image = fit_canvas(pil_image, rotated)
+    if overlay_rects:
+        pil_image, offset = _composite_overlays(pil_image, overlay_rects)
+    if pil_image.mode not in ("RGB", "RGBA"):
+        # Hand ImageTk pixels it can copy straight into Tk
+        pil_image = pil_image.convert("RGBA")
+    image = ImageTk.PhotoImage(pil_image, master=master)
+    cached = (image, offset)
+    _ROTATED_IMG_CACHE[key] = cached
+    return cached
+
+
+# Paired glyphs swap when text is mirrored so brackets still face inwards
+_MIRROR_TABLE = str.maketrans("()[]{}<>", ")(][}{><")
+
+
+@lru_cache(maxsize=2048)
+def _mirror(text):
+    """Reverse text for the VR mirror, flipping paired glyphs"""
+    if "\n" in text:
+        # Each line is mirrored on its own so the line order stays top to bottom
+        return "\n".join(map(_mirror, text.split("\n")))
+    text = text.translate(_MIRROR_TABLE)
+    if text.isascii():
+        return text[::-1]
+    # Reverse whole graphemes so combining marks stay after their base character
+    clusters = []
+    for ch in text:
+        if clusters and unicodedata.combining(ch):
+            clusters[-1] += ch
+        else:
+            clusters.append(ch)
+    return "".join(reversed(clusters))
+
+
+@lru_cache(maxsize=256)
+def _rotated_layout(y, font_size, canvas_width, canvas_height, rotated):
+    """Compute (x, y, scaled font size) for centered text, numbers only"""
+    # Make font size larger for better visibility but not too large to cause cutoff
+    scaled_font_size = int(font_size * 1.2)  # Reduced from 1.5 to prevent cutoff
+    
+    # Calculate y position as a percentage of screen height for better scaling
+    # Adjust to ensure text is not cut off at the bottom
+    y_percent = y / 1080  # Convert fixed y to percentage of reference height
+    scaled_y = int(y_percent * canvas_height)  # Apply percentage to actual height
+    
+    # If rotation is enabled, swap x and y coordinates (90 degrees left rotation)
+    if rotated:
+        # The original y becomes the x coordinate, centered horizontally in rotated view
+        return scaled_y, canvas_width / 2, scaled_font_size
+    # Standard non-rotated display - use center of canvas
+    return canvas_width / 2, scaled_y, scaled_font_size
+
+
+@lru_cache(maxsize=1024)
+def _compute_center_text_layout(text, y, font_size, width, font_family,
+                                canvas_width, canvas_height, mirrored, rotated):
+    """Compute (x, y, text, font, wrap width) for a center_text call"""
+    x, y, scaled_font_size = _rotated_layout(y, font_size, canvas_width, canvas_height, rotated)
+    
+    # Use a much smaller width to prevent text from being cut off at edges
+    if width:
+        wrap_width = width * 0.7  # Reduce width by 30% to prevent cutoff
+    else:
+        # Set a default width that's 60% of the canvas width to prevent cutoff
+        wrap_width = canvas_width * 0.6
+    
+    # If mirroring is enabled, reverse the text
+    if mirrored:
+        text = _mirror(text)
+    
+    return x, y, text, (font_family, scaled_font_size), wrap_width
+
 
 class GUIAdapter:
     """Base adapter class for GUI files"""
+    SPEC = None  # SceneSpec, set by each scene subclass
+    WIDTH, HEIGHT = CANVAS_SIZE
+    __slots__ = (
+        "master", "canvas", "assets", "is_visible", "mirrored", "rotated",
+        "_wrap_cache", "_transcription_item", "_transcription_shown",
+        "_cached_cw", "_cached_ch", "_tag", "_redraw_id", "_pending_fn",
+    )
+    
     def __init__(self, master=None):
         self.master = master
         self.canvas = None
@@ -15,10 +237,165 @@ class GUIAdapter:
         self.is_visible = False
         self.mirrored = True  # Enable mirroring by default for VR glasses
         self.rotated = True  # Enable 90 degree rotation to the left
+        self._wrap_cache = {}  # (text, max_chars) -> wrapped lines
+        self._transcription_item = None  # Reused multi-line text item
+        self._transcription_shown = None  # (x, y, text) last applied to that item
+        self._cached_cw = None  # Canvas size, kept current by <Configure>
+        self._cached_ch = None
+        self._tag = f"scene_{self.SPEC.assets if self.SPEC else None}"  # Tag on every item this scene owns
+        self._redraw_id = None  # after_idle id of the queued _flush
+        self._pending_fn = None  # Latest redraw requested before that flush
         
     def setup(self):
-        """To be implemented by child classes"""
-        pass
+        """Build the scene described by the class's SPEC"""
+        if self.SPEC is not None:
+            self._build_scene(self.SPEC)
+        
+    def _on_configure(self, event):
+        """Track the canvas size and drop memoized text layouts on resize"""
+        self._cached_cw = event.width
+        self._cached_ch = event.height
+        _compute_center_text_layout.cache_clear()
+        _rotated_layout.cache_clear()
+        
+    def _font(self, family, size):
+        """Return the named Tk font shared by every scene on this root"""
+        return _get_font(self.master, family, size)
+        
+    def _preload_fonts(self, family="Arial Bold"):
+        """Resolve the fonts center_text will ask for ahead of the first draw"""
+        # Only the first scene set up on a root creates these, later ones find them cached
+        for size in PRELOAD_FONT_SIZES:
+            self._font(family, int(size * 1.2))  # Same scaling as center_text
+        
+    def _attach_canvas(self):
+        """Return the canvas shared by every scene, creating it on first use"""
+        global _shared_canvas
+        if _shared_canvas is not None and _shared_canvas.master is self.master:
+            return _shared_canvas
+        
+        # For 90 degree rotation, swap width and height
+        if self.rotated:
+            width, height = self.HEIGHT, self.WIDTH
+        else:
+            width, height = self.WIDTH, self.HEIGHT
+            
+        # Center the window on the screen, the screen size needs no idle
+        # flush and is only queried once since the canvas is shared
+        x = (self.master.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.master.winfo_screenheight() // 2) - (height // 2)
+        self.master.geometry(f"{width}x{height}+{x}+{y}")
+        self.master.configure(bg="#000000")
+        
+        # Create the canvas with rotated dimensions
+        _shared_canvas = Canvas(
+            self.master,
+            bg="#000000",
+            height=height,
+            width=width,
+            bd=0,
+            highlightthickness=0,
+            relief="ridge"
+        )
+        _shared_canvas.place(x=0, y=0)
+        self.master.resizable(False, False)
+        return _shared_canvas
+        
+    def _build_scene(self, spec):
+        """Attach the shared canvas and draw a SceneSpec on it"""
+        global _shared_root
+        # All scenes share one Tk root rather than each building its own window
+        if self.master is None:
+            if _shared_root is None:
+                _shared_root = tk.Tk()
+            self.master = _shared_root
+        elif _shared_root is None:
+            _shared_root = self.master
+        if self.canvas is None:
+            self.canvas = self._attach_canvas()
+            # A scene rebuilt from scratch replaces whatever its last instance drew
+            self.canvas.delete(self._tag)
+            width = int(self.canvas.cget("width"))
+            height = int(self.canvas.cget("height"))
+            
+            # Canvas size is cached here and on <Configure> rather than polled per draw
+            self._cached_cw = width
+            self._cached_ch = height
+            self.canvas.bind("<Configure>", self._on_configure, add="+")
+            self._preload_fonts()
+            
+            self._draw_scene(spec)
+            self.is_visible = True
+        
+        # Ensure the scene is displayed
+        self.show()
+        
+    def _draw_scene(self, spec):
+        """Draw the background image and title for a SceneSpec"""
+        width, height = self._cached_cw, self._cached_ch
+        if self.rotated:
+            # Place the rotated image at the center of the rotated canvas
+            image_x, image_y = width / 2, height / 2
+        else:
+            # Standard non-rotated display, centered horizontally
+            image_x, image_y = width / 2, spec.image_y
+        
+        # The static rectangle is baked into the cached image rather
+        # than drawn as its own canvas item
+        overlays = ()
+        if spec.rect:
+            left, top, right, bottom = self._rect_coords(spec.rect, width, height)
+            overlays = ((left - image_x, top - image_y, right - image_x, bottom - image_y, "#92FBFF"),)
+        
+        # Load image (cached across scene setups)
+        try:
+            image, (dx, dy) = _load_rotated_photo(_FRAME_PATHS[spec.assets], self.rotated, self.master, overlays)
+            self.assets["image_1.png"] = image
+            self.canvas.create_image(
+                image_x + dx,
+                image_y + dy,
+                image=image,
+                anchor="center"
+            )
+        except Exception as e:
+            print(f"Error loading image: {e}")
+        
+        # Add centered text with larger font
+        self.center_text(" ", spec.text_y, font_size=70)
+        self._claim_items()
+        
+    def reset(self):
+        """Put the scene back the way setup() left it, reusing the canvas and cached image"""
+        if self.canvas is None:
+            self.setup()
+            return
+        self.clear()
+        self._draw_scene(self.SPEC)
+        if not self.is_visible:
+            self.canvas.itemconfigure(self._tag, state="hidden")
+        
+    def _claim_items(self):
+        """Tag items drawn on the shared canvas since the last claim as this scene's"""
+        # Only the visible scene is drawn on, so any untagged item is ours
+        self.canvas.addtag_withtag(self._tag, "!scene")
+        self.canvas.addtag_withtag("scene", self._tag)
+        
+    def _rect_coords(self, rect, width, height):
+        """Canvas (left, top, right, bottom) of a scene's (width, height, top) rectangle"""
+        rect_width, rect_height, top = rect
+        if self.rotated:
+            # In rotated view, swap coordinates
+            rect_left = height / 2 - rect_height / 2  # Center vertically in rotated view
+            rect_right = height / 2 + rect_height / 2
+            rect_top = width / 2 - rect_width / 2  # Center horizontally in rotated view
+            rect_bottom = width / 2 + rect_width / 2
+        else:
+            # Standard non-rotated display
+            rect_left = width / 2 - rect_width / 2
+            rect_right = width / 2 + rect_width / 2
+            rect_top = top
+            rect_bottom = rect_top + rect_height
+        return rect_left, rect_top, rect_right, rect_bottom
         
     def load(self):
         """Load the GUI content"""
@@ -29,136 +406,181 @@ class GUIAdapter:
     def clear(self):
         """Clear the canvas"""
         if self.canvas:
-            self.canvas.delete("all")
+            self._cancel_redraw()
+            self._claim_items()
+            self.canvas.delete(self._tag)
+            # Reused transcription items were deleted along with everything else
+            self._transcription_item = None
             
     def hide(self):
-        """Hide the canvas"""
+        """Hide this scene's items on the shared canvas"""
         if self.canvas and self.is_visible:
-            self.canvas.place_forget()
+            self._cancel_redraw()
+            self._claim_items()
+            self.canvas.itemconfigure(self._tag, state="hidden")
             self.is_visible = False
             
     def show(self):
-        """Show the canvas"""
-        if self.canvas and not self.is_visible:
-            self.canvas.place(x=0, y=0)
+        """Show this scene's items on the shared canvas, building the scene on first use"""
+        if self.canvas is None:
+            self.setup()  # Draws the scene and shows it
+            return
+        if not self.is_visible:
+            self.canvas.itemconfigure(self._tag, state="normal")
+            # An emptied transcription stays hidden until new text arrives
+            if self._transcription_item is not None and self._transcription_shown is None:
+                self.canvas.itemconfigure(self._transcription_item, state="hidden")
             self.is_visible = True
             
     def show_text(self, text, x, y, font_size=40, anchor="nw", fill="#FFFFFF", font_family="Inter ExtraBold"):
         """Show text on the canvas"""
         if self.canvas:
+            key = (font_family, font_size)
+            font = _FONT_TUPLE_CACHE.get(key)
+            if font is None:
+                # Built once per (family, size) rather than on every call
+                font = _FONT_TUPLE_CACHE[key] = (font_family, font_size * -1)
             return self.canvas.create_text(
                 x, y,
                 text=text,
                 anchor=anchor,
                 fill=fill,
-                font=(font_family, font_size * -1)
+                font=font
             )
     
+    def _text_layout(self, text, y, font_size, font_family, width):
+        """Return the memoized (x, y, text, font, wrap width) for centered text"""
+        # Get canvas dimensions for proper centering
+        canvas_width = self._cached_cw or self.WIDTH  # Default to 720 if not yet rendered
+        canvas_height = self._cached_ch or self.HEIGHT  # Default to 1080 if not yet rendered
+        
+        # Geometry and mirroring are memoized, only the Tk call happens per draw
+        return _compute_center_text_layout(
+            text, y, font_size, width, font_family,
+            canvas_width, canvas_height, self.mirrored, self.rotated
+        )
+    
+    def line_chars(self, font_size=40, font_family="Arial Bold"):
+        """Roughly how many characters center_text fits on one line at this size"""
+        _, _, _, font, wrap_width = self._text_layout(" ", 0, font_size, font_family, None)
+        return max(1, int(wrap_width // self._font(*font).measure("n")))
+    
     def center_text(self, text, y, font_size=40, fill="#FFFFFF", font_family="Arial Bold", width=None):
         """Show centered text on the canvas with simple mirroring for VR glasses and rotation"""
         if self.canvas:
-            # Get canvas dimensions for proper centering
-            canvas_width = self.canvas.winfo_width() or 720  # Default to 720 if not yet rendered
-            canvas_height = self.canvas.winfo_height() or 1080  # Default to 1080 if not yet rendered
-            
-            # Make font size larger for better visibility but not too large to cause cutoff
-            scaled_font_size = int(font_size * 1.2)  # Reduced from 1.5 to prevent cutoff
-            
-            # Calculate y position as a percentage of screen height for better scaling
-            # Adjust to ensure text is not cut off at the bottom
-            y_percent = y / 1080  # Convert fixed y to percentage of reference height
-            scaled_y = int(y_percent * canvas_height)  # Apply percentage to actual height
+            x, y, display_text, font, wrap_width = self._text_layout(text, y, font_size, font_family, width)
             
-            # Create text with optional width constraint for wrapping
+            # Create text with width constraint for wrapping
             # Use the provided fill color (default is white)
-            kwargs = {
-                "text": text,
-                "anchor": "center",
-                "fill": fill,  # Use the provided fill color
-                "font": (font_family, scaled_font_size),
-                "justify": "center"
-            }
+            args = [
+                "-text", display_text,
+                "-anchor", "center",
+                "-fill", fill,  # Use the provided fill color
+                "-font", self._font(*font),  # Layout tuple is the cache key
+                "-justify", "center",
+                "-width", wrap_width,
+            ]
             
-            # Add width parameter if provided (for text wrapping)
-            # Use a much smaller width to prevent text from being cut off at edges
-            if width:
-                kwargs["width"] = width * 0.7  # Reduce width by 30% to prevent cutoff
-            else:
-                # Set a default width that's 60% of the canvas width to prevent cutoff
-                kwargs["width"] = canvas_width * 0.6
+            # If rotation is enabled, rotate the text 90 degrees to the left
+            if self.rotated:
+                args += ["-angle", 90]
             
-            # If mirroring is enabled, reverse the text
-            if self.mirrored:
-                # Simple mirroring - just reverse the text
-                mirrored_text = text[::-1]
-                kwargs["text"] = mirrored_text
+            # Create the main text - no outline/shadow to keep it clean
+            # Calling Tcl directly skips Canvas.create_text's kwargs conversion
+            canvas = self.canvas
+            return canvas.tk.getint(canvas.tk.call(canvas._w, "create", "text", x, y, *args))
             
-            # If rotation is enabled, swap x and y coordinates (90 degrees left rotation)
-            if self.rotated:
-                # For 90 degrees left rotation, adjust positioning to respect the y parameter
-                # Use the provided y position for the rotated x coordinate
-                rotated_x = scaled_y  # The original y becomes the x coordinate
-                rotated_y = canvas_width / 2  # Center horizontally in rotated view
-                
-                # Create the main text - no outline/shadow to keep it clean
-                text_id = self.canvas.create_text(
-                    rotated_x,
-                    rotated_y,
-                    angle=90,  # Rotate text 90 degrees
-                    **kwargs
-                )
-            else:
-                # Standard non-rotated display - use center of canvas
-                text_id = self.canvas.create_text(
-                    canvas_width / 2,  # Center horizontally
-                    scaled_y,          # Use calculated vertical position
-                    **kwargs
-                )
+    def set_text(self, item, text):
+        """Replace the text of an item drawn by center_text, mirrored the same way"""
+        if self.canvas:
+            self.canvas.itemconfigure(item, text=_mirror(text) if self.mirrored else text)
+            
+    def _schedule(self, fn):
+        """Run fn at the next idle pass, later requests before then replace it"""
+        self._pending_fn = fn
+        if self._redraw_id is None:
+            self._redraw_id = self.master.after_idle(self._flush)
             
-            return text_id
+    def _flush(self):
+        """Run the redraw queued by _schedule"""
+        self._redraw_id = None
+        fn, self._pending_fn = self._pending_fn, None
+        if fn is not None:
+            fn()
             
+    def _cancel_redraw(self):
+        """Drop a redraw queued by _schedule, it must not draw once the scene is hidden or cleared"""
+        if self._redraw_id is not None:
+            self.master.after_cancel(self._redraw_id)
+            self._redraw_id = None
+        self._pending_fn = None
+        
+    def _wrap(self, text, max_chars):
+        """Split text into lines of at most max_chars, cached per distinct text"""
+        key = (text, max_chars)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            if len(text) <= max_chars:
+                # Short partials are the common case and need no wrapping at all
+                lines = [" ".join(text.split())]
+            else:
+                # Long words stay on their own line, same as the previous manual wrap
+                lines = textwrap.wrap(text, width=max_chars, break_long_words=False, break_on_hyphens=False)
+            if len(self._wrap_cache) >= 256:
+                self._wrap_cache.clear()
+            self._wrap_cache[key] = lines
+        return lines
+        
     def show_transcription(self, text):
-        """Show transcription text on a black background"""
-        self.clear()  # Clear all canvas items, including images
+        """Show transcription text on a black background at the next idle pass"""
+        # Bursts of partials collapse into a single redraw of the newest text
+        self._schedule(partial(self._draw_transcription, text))
+        
+    def _draw_transcription(self, text):
+        """Lay out and draw transcription text on the reused item"""
+        # Claiming items below would adopt another scene's if this one is not shown
+        if not self.is_visible:
+            return
+            
         # Get canvas dimensions
-        canvas_width = self.canvas.winfo_width() or 720  # Default to 720 if not yet rendered
-        canvas_height = self.canvas.winfo_height() or 1080  # Default to 1080 if not yet rendered
+        canvas_width = self._cached_cw or self.WIDTH  # Default to 720 if not yet rendered
+        canvas_height = self._cached_ch or self.HEIGHT  # Default to 1080 if not yet rendered
+        canvas = self.canvas  # Bound once, this runs for every transcription update
         
-        # Create black background covering the entire canvas
-        # Make sure there are no other elements like gray bars
-        self.canvas.create_rectangle(0, 0, canvas_width, canvas_height, fill="#000000", outline="")
+        # The text item is created once and reconfigured on every update instead of redrawn
+        if self._transcription_item is None:
+            # Use white text (#FFFFFF) instead of yellow
+            self._transcription_item = self.center_text("", 0, font_size=25, fill="#FFFFFF")
+            canvas.addtag_withtag("transcription", self._transcription_item)
+            self._transcription_shown = None
+        # The canvas bg is already black, so hiding everything else this scene
+        # has drawn leaves the transcription on a black screen without a
+        # full-screen rectangle item
+        self._claim_items()
+        canvas.itemconfigure(f"{self._tag}&&!transcription", state="hidden")
         
         # If text is empty, just show a blank black screen
         if not text or text.strip() == "":
+            canvas.itemconfigure(self._transcription_item, state="hidden")
+            self._transcription_shown = None
             return
             
         # Show the transcription text with word wrapping
-        lines = []
-        current_line = ""
         # Further reduce max_chars to prevent text from being cut off at edges
         max_chars = 20  # Significantly reduced to prevent text cutoff
         
-        # Split text into words and handle word wrapping
-        for word in text.split():
-            # If adding this word would exceed max_chars, start a new line
-            if len(current_line + " " + word) <= max_chars:
-                current_line += " " + word if current_line else word
-            else:
-                lines.append(current_line)
-                current_line = word
-                
-        # Add the last line if it has content
-        if current_line:
-            lines.append(current_line)
-        
-        # If no lines were created (e.g., single very long word), split the text manually
-        if not lines and text:
-            # Split the text into chunks of max_chars
-            for i in range(0, len(text), max_chars):
-                lines.append(text[i:i+max_chars])
+        if self.mirrored:
+            # Mirrored lines have to be split here so each one can be reversed on its own
+            lines = self._wrap(text, max_chars)
+            line_count = len(lines)
+        else:
+            # Tk wraps the item at its pixel width in C, so only the line
+            # count is estimated here to place the block
+            block = " ".join(text.split())
+            line_count = max(1, -(-len(block) // max_chars))
         
         # Calculate vertical centering with more space at top and bottom
-        total_height = len(lines) * 60  # Increased spacing between lines
+        total_height = line_count * 60  # Increased spacing between lines
         
         # Start higher up on the screen to avoid bottom cutoff
         start_y = (canvas_height - total_height) / 2 - 50  # Shift up by 50 pixels
@@ -168,308 +590,34 @@ class GUIAdapter:
             start_y = 150  # Increased minimum top margin
         if start_y + total_height > canvas_height - 150:
             start_y = canvas_height - total_height - 150  # Ensure bottom margin
-            
-        y_pos = start_y  # Start position adjusted vertically
         
-        # Display each line with proper spacing
-        for line in lines:
-            # Use white text (#FFFFFF) instead of yellow
-            self.center_text(line, y_pos, font_size=25, fill="#FFFFFF")  # Changed to white
-            y_pos += 60  # Increased spacing between lines for better readability
+        # All lines go into one multi-line item centered on the block, so Tk
+        # does a single layout pass instead of one per line
+        center_y = start_y + (line_count - 1) * 30
+        x, y, _ = _rotated_layout(center_y, 25, canvas_width, canvas_height, self.rotated)
+        if self.mirrored:
+            # Mirror each line on its own so the line order stays top to bottom
+            block = "\n".join(_mirror(line) for line in lines)
+        # Repeated partials often produce the same block, skip Tk entirely then
+        if (x, y, block) != self._transcription_shown:
+            canvas.coords(self._transcription_item, x, y)
+            canvas.itemconfigure(self._transcription_item, text=block, state="normal")
+            self._transcription_shown = (x, y, block)
 
 
 class GUI(GUIAdapter):
     """Adapter for gui.py (Scene 1 - Live Transcription)"""
-    def __init__(self, master=None):
-        super().__init__(master)
-        
-    def setup(self):
-        if self.master is None:
-            self.master = tk.Tk()
-        if self.canvas is None:
-            # For 90 degree rotation, swap width and height
-            if self.rotated:
-                width = 1080
-                height = 720
-            else:
-                width = 720
-                height = 1080
-                
-            # Center the window on the screen
-            self.master.update_idletasks()
-            x = (self.master.winfo_screenwidth() // 2) - (width // 2)
-            y = (self.master.winfo_screenheight() // 2) - (height // 2)
-            self.master.geometry(f"{width}x{height}+{x}+{y}")
-            
-            # Create canvas with black background
-            self.canvas = Canvas(
-                self.master,
-                width=width,
-                height=height,
-                bg="#000000",  # Pure black background
-                highlightthickness=0,  # Remove any border
-                borderwidth=0  # Remove any border
-            )
-            self.canvas.place(x=0, y=0)  # Position at top-left corner
-            self.master.configure(bg="#000000")
-            
-            # Create the canvas with rotated dimensions
-            self.canvas = Canvas(
-                self.master,
-                bg="#000000",
-                height=height,
-                width=width,
-                bd=0,
-                highlightthickness=0,
-                relief="ridge"
-            )
-            
-            # Set the assets path
-            script_dir = Path(__file__).parent
-            assets_path = script_dir / "assets" / "frame0"
-            
-            # Load image
-            try:
-                image_path = assets_path / "image_1.png"
-                
-                if self.rotated:
-                    # Load with PIL to rotate
-                    pil_image = Image.open(str(image_path))
-                    pil_image = pil_image.rotate(90, expand=True)  # Rotate 90 degrees left
-                    image = ImageTk.PhotoImage(pil_image)
-                    self.assets["image_1.png"] = image
-                    
-                    # Place the rotated image
-                    self.canvas.create_image(
-                        width / 2,  # Centered horizontally in the rotated canvas
-                        height / 2,  # Centered vertically in the rotated canvas
-                        image=image,
-                        anchor="center"
-                    )
-                else:
-                    # Standard non-rotated display
-                    image = PhotoImage(file=str(image_path))
-                    self.assets["image_1.png"] = image
-                    
-                    # Place the image at the center of the canvas
-                    self.canvas.create_image(
-                        360.0,  # Centered horizontally
-                        425.0,
-                        image=image
-                    )
-            except Exception as e:
-                print(f"Error loading image: {e}")
-            
-            # Add centered text with larger font
-            self.center_text(" ", 711.0, font_size=70)
-            
-            self.master.resizable(False, False)
-        
-        # Ensure the canvas is displayed
-        self.canvas.place(x=0, y=0)
-        self.is_visible = True
+    __slots__ = ()
+    SPEC = SceneSpec("frame0", image_y=425.0, text_y=711.0)
 
 
 class GUI1(GUIAdapter):
     """Adapter for gui1.py (Scene 2 - Russian Translation)"""
-    def __init__(self, master=None):
-        super().__init__(master)
-        
-    def setup(self):
-        if self.master is None:
-            self.master = tk.Tk()
-        if self.canvas is None:
-            # For 90 degree rotation, swap width and height
-            if self.rotated:
-                width = 1080
-                height = 720
-            else:
-                width = 720
-                height = 1080
-                
-            # Center the window on the screen
-            self.master.update_idletasks()
-            x = (self.master.winfo_screenwidth() // 2) - (width // 2)
-            y = (self.master.winfo_screenheight() // 2) - (height // 2)
-            self.master.geometry(f"{width}x{height}+{x}+{y}")
-            self.master.configure(bg="#000000")
-            
-            # Create the canvas with rotated dimensions
-            self.canvas = Canvas(
-                self.master,
-                bg="#000000",
-                height=height,
-                width=width,
-                bd=0,
-                highlightthickness=0,
-                relief="ridge"
-            )
-            
-            # Set the assets path
-            script_dir = Path(__file__).parent
-            assets_path = script_dir / "assets" / "frame1"
-            
-            # Load image
-            try:
-                image_path = assets_path / "image_1.png"
-                
-                if self.rotated:
-                    # Load with PIL to rotate
-                    pil_image = Image.open(str(image_path))
-                    pil_image = pil_image.rotate(90, expand=True)  # Rotate 90 degrees left
-                    image = ImageTk.PhotoImage(pil_image)
-                    self.assets["image_1.png"] = image
-                    
-                    # Place the rotated image
-                    self.canvas.create_image(
-                        width / 2,  # Centered horizontally in the rotated canvas
-                        height / 2,  # Centered vertically in the rotated canvas
-                        image=image,
-                        anchor="center"
-                    )
-                else:
-                    # Standard non-rotated display
-                    image = PhotoImage(file=str(image_path))
-                    self.assets["image_1.png"] = image
-                    
-                    # Place the image at the center of the canvas
-                    self.canvas.create_image(
-                        360.0,  # Centered horizontally
-                        401.0,
-                        image=image
-                    )
-            except Exception as e:
-                print(f"Error loading image: {e}")
-            
-            # Add centered text with larger font
-            self.center_text(" ", 727.0, font_size=70)
-            
-            self.master.resizable(False, False)
-        
-        # Ensure the canvas is displayed
-        self.canvas.place(x=0, y=0)
-        self.is_visible = True
+    __slots__ = ()
+    SPEC = SceneSpec("frame1", image_y=401.0, text_y=727.0)
 
 
 class GUI2(GUIAdapter):
     """Adapter for gui2.py (Scene 3 - Camera recorder)"""
-    def __init__(self, master=None):
-        super().__init__(master)
-        
-    def setup(self):
-        if self.master is None:
-            self.master = tk.Tk()
-        if self.canvas is None:
-            # For 90 degree rotation, swap width and height
-            if self.rotated:
-                width = 1080
-                height = 720
-                canvas_width = width
-            else:
-                width = 720
-                height = 1080
-                canvas_width = width
-                
-            # Center the window on the screen
-            self.master.update_idletasks()
-            x = (self.master.winfo_screenwidth() // 2) - (width // 2)
-            y = (self.master.winfo_screenheight() // 2) - (height // 2)
-            self.master.geometry(f"{width}x{height}+{x}+{y}")
-            self.master.configure(bg="#000000")
-            
-            # Create the canvas with rotated dimensions
-            self.canvas = Canvas(
-                self.master,
-                bg="#000000",
-                height=height,
-                width=width,
-                bd=0,
-                highlightthickness=0,
-                relief="ridge"
-            )
-            
-            # Get the exact center of the canvas
-            canvas_center_x = canvas_width / 2
-            
-            if self.rotated:
-                # For rotated view, adjust the rectangle position
-                rect_width = 494
-                rect_height = 494
-                
-                # In rotated view, swap coordinates
-                rect_left = height / 2 - rect_height / 2  # Center vertically in rotated view
-                rect_right = height / 2 + rect_height / 2
-                rect_top = width / 2 - rect_width / 2  # Center horizontally in rotated view
-                rect_bottom = width / 2 + rect_width / 2
-                
-                self.canvas.create_rectangle(
-                    rect_left,
-                    rect_top,
-                    rect_right,
-                    rect_bottom,
-                    fill="#92FBFF",
-                    outline=""
-                )
-            else:
-                # Standard non-rotated display
-                rect_width = 494  # 607 - 113
-                rect_height = 494  # 636 - 142
-                rect_left = canvas_center_x - (rect_width / 2)
-                rect_right = canvas_center_x + (rect_width / 2)
-                rect_top = 293  # Center vertically (1080/2 - rect_height/2)
-                rect_bottom = rect_top + rect_height
-                
-                self.canvas.create_rectangle(
-                    rect_left,
-                    rect_top,
-                    rect_right,
-                    rect_bottom,
-                    fill="#92FBFF",
-                    outline=""
-                )
-            
-            # Set the assets path
-            script_dir = Path(__file__).parent
-            assets_path = script_dir / "assets" / "frame2"
-            
-            # Load image
-            try:
-                image_path = assets_path / "image_1.png"
-                
-                if self.rotated:
-                    # Load with PIL to rotate
-                    pil_image = Image.open(str(image_path))
-                    pil_image = pil_image.rotate(90, expand=True)  # Rotate 90 degrees left
-                    image = ImageTk.PhotoImage(pil_image)
-                    self.assets["image_1.png"] = image
-                    
-                    # Place the rotated image at the center
-                    self.canvas.create_image(
-                        width / 2,  # Center horizontally in rotated view
-                        height / 2,  # Center vertically in rotated view
-                        image=image,
-                        anchor="center"
-                    )
-                else:
-                    # Standard non-rotated display
-                    image = PhotoImage(file=str(image_path))
-                    self.assets["image_1.png"] = image
-                    
-                    # Place the image exactly at the center of the canvas
-                    self.canvas.create_image(
-                        canvas_center_x,  # Exactly centered horizontally
-                        540,  # Center of the screen vertically (1080/2)
-                        image=image,
-                        anchor="center"  # Important: use center anchor for proper centering
-                    )
-            except Exception as e:
-                print(f"Error loading image: {e}")
-            
-            # Add centered text with larger font
-            self.center_text(" ", 749.0, font_size=70)
-            
-            self.master.resizable(False, False)
-        
-        # Ensure the canvas is displayed
-        self.canvas.place(x=0, y=0)
-        self.is_visible = True
\ No newline at end of file
+    __slots__ = ()
+    SPEC = SceneSpec("frame2", image_y=540, text_y=749.0, rect=(494, 494, 293))
@@ -1,30 +1,57 @@
-import threading
+import os
+import atexit
+import sys
 import time
 import platform
+import threading
+import logging
+from functools import partial
 
-# Try to import GPIO libraries, with fallback for non-Raspberry Pi environments
-try:
-    from gpiozero import Button
-    GPIO_AVAILABLE = True
-except (ImportError, ModuleNotFoundError):
-    GPIO_AVAILABLE = False
-    print("GPIO not available. Running in keyboard-only mode.")
+# Button presses are logged at DEBUG level on the app's shared logger
+log = logging.getLogger("vrapp")
 
 # Check if we're on macOS
 IS_MACOS = platform.system() == 'Darwin'
 
-# For non-macOS, try to use the keyboard module
-if not IS_MACOS:
-    try:
-        import keyboard
-        KEYBOARD_AVAILABLE = True
-    except (ImportError, ModuleNotFoundError):
-        KEYBOARD_AVAILABLE = False
-        print("Keyboard module not available.")
-else:
-    # On macOS, we'll use Tkinter bindings instead
-    KEYBOARD_AVAILABLE = False
-    print("On macOS, using Tkinter for keyboard input instead of keyboard module.")
+# GPIO and keyboard libraries are only imported when an InputHandler is
+# created, the flags stay None until then
+Button = None
+keyboard = None
+GPIO_AVAILABLE = None
+KEYBOARD_AVAILABLE = None
+
+
+def _load_gpio():
+    """Import gpiozero on first use, True if GPIO buttons are available"""
+    global Button, GPIO_AVAILABLE
+    if GPIO_AVAILABLE is None:
+        # Try to import GPIO libraries, with fallback for non-Raspberry Pi environments
+        try:
+            from gpiozero import Button
+            GPIO_AVAILABLE = True
+        except (ImportError, ModuleNotFoundError):
+            GPIO_AVAILABLE = False
+            print("GPIO not available. Running in keyboard-only mode.")
+    return GPIO_AVAILABLE
+
+
+def _load_keyboard():
+    """Import the keyboard module on first use, True if it can be used"""
+    global keyboard, KEYBOARD_AVAILABLE
+    if KEYBOARD_AVAILABLE is None:
+        if IS_MACOS:
+            # On macOS, we'll use Tkinter bindings instead
+            KEYBOARD_AVAILABLE = False
+            print("On macOS, using Tkinter for keyboard input instead of keyboard module.")
+        else:
+            try:
+                import keyboard
+                KEYBOARD_AVAILABLE = True
+            except (ImportError, ModuleNotFoundError):
+                KEYBOARD_AVAILABLE = False
+                print("Keyboard module not available.")
+    return KEYBOARD_AVAILABLE
+
 
 class InputHandler:
     """
@@ -35,24 +62,36 @@ class InputHandler:
     Button 3: Confirm/Translate/Back (GPIO 22, Key 3)
     """
     def __init__(self):
+        # Tuples are rebuilt on the rare register and just iterated on every press
         self.callbacks = {
-            'button1': [],
-            'button2': [],
-            'button3': []
+            'button1': (),
+            'button2': (),
+            'button3': ()
         }
         
-        self.running = False
-        self.keyboard_thread = None
         self.buttons = {}
         self.root = None
+        self.running = False
+        self.stdin_thread = None
+        self._saved_tty = None  # Terminal settings restored by cleanup
+        self.last_press = {}  # Button name -> time of the last accepted press
+        self.debounce_interval = 0.3  # Presses closer together than this are ignored
         
         # Set up GPIO buttons if available
-        if GPIO_AVAILABLE:
+        if _load_gpio():
             self._setup_gpio()
             
-        # Set up keyboard inputs if not on macOS
-        if KEYBOARD_AVAILABLE and not IS_MACOS:
-            self._setup_keyboard()
+        # Map keys to button names
+        self.key_mapping = {
+            '1': 'button1',
+            '2': 'button2',
+            '3': 'button3'
+        }
+        
+        # Set up keyboard inputs if not on macOS, headless Linux without
+        # the keyboard module (or root) reads the terminal instead
+        if not (_load_keyboard() and self._setup_keyboard()) and not IS_MACOS:
+            self._setup_stdin()
     
     def _setup_gpio(self):
         """Set up GPIO buttons"""
@@ -67,32 +106,76 @@ class InputHandler:
             # Create button objects and set up callbacks
             for name, pin in pins.items():
                 self.buttons[name] = Button(pin, pull_up=True)
-                self.buttons[name].when_pressed = lambda btn=name: self._button_callback(btn)
+                self.buttons[name].when_pressed = partial(self._button_callback, name)
                 
             print("GPIO buttons initialized")
         except Exception as e:
             print(f"Error setting up GPIO: {e}")
     
     def _setup_keyboard(self):
-        """Set up keyboard input handling"""
+        """Set up keyboard input handling, True if the hooks were installed"""
         if not KEYBOARD_AVAILABLE:
+            return False
+            
+        # Hook key presses instead of polling them from a thread
+        try:
+            for key, button in self.key_mapping.items():
+                keyboard.on_press_key(key, lambda event, btn=button: self._button_callback(btn), suppress=False)
+        except Exception as e:
+            # On Linux the global hook needs root
+            print(f"Error setting up keyboard hooks: {e}")
+            return False
+        
+        print("Keyboard input initialized")
+        return True
+        
+    def _setup_stdin(self):
+        """Read button keys from the controlling terminal, no root or global hook needed"""
+        if not sys.stdin.isatty():
+            return
+        try:
+            import termios
+            import tty
+        except ImportError:
             return
             
-        # Map keys to button names
-        self.key_mapping = {
-            '1': 'button1',
-            '2': 'button2',
-            '3': 'button3'
-        }
+        fd = sys.stdin.fileno()
+        self._saved_tty = termios.tcgetattr(fd)
+        # Restore the terminal even if the app dies before cleanup() runs
+        atexit.register(self._restore_tty)
+        tty.setcbreak(fd)  # Deliver keys one at a time, without waiting for Enter
         
-        # Start keyboard monitoring thread
         self.running = True
-        self.keyboard_thread = threading.Thread(target=self._keyboard_monitor)
-        self.keyboard_thread.daemon = True
-        self.keyboard_thread.start()
+        self.stdin_thread = threading.Thread(target=self._stdin_monitor)
+        self.stdin_thread.daemon = True
+        self.stdin_thread.start()
         
-        print("Keyboard input initialized")
+        print("Terminal keyboard input initialized")
+        
+    def _stdin_monitor(self):
+        """Dispatch keys typed on the terminal, sleeping in select() between them"""
+        import select
+        
+        fd = sys.stdin.fileno()
+        while self.running:
+            # The timeout only bounds how long cleanup waits for this thread
+            readable, _, _ = select.select([fd], [], [], 0.2)
+            if readable:
+                # Read the raw fd so no keys linger in Python's stdin buffer
+                button = self.key_mapping.get(os.read(fd, 1).decode(errors="ignore"))
+                if button:
+                    self._button_callback(button)
         
+    def _restore_tty(self):
+        """Put the terminal back the way _setup_stdin found it, safe to call twice"""
+        if self._saved_tty is not None:
+            import termios
+            try:
+                termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved_tty)
+            except (termios.error, ValueError) as e:
+                print(f"Error restoring terminal: {e}")
+            self._saved_tty = None
+            
     def setup_tkinter_bindings(self, root):
         """Set up Tkinter key bindings for macOS"""
         if not IS_MACOS:
@@ -107,31 +190,18 @@ class InputHandler:
         
         print("Tkinter keyboard bindings initialized")
     
-    def _keyboard_monitor(self):
-        """Monitor keyboard inputs in a separate thread"""
-        if not KEYBOARD_AVAILABLE:
+    def _button_callback(self, button_name, *args):
+        """Handle button press events, extra args (e.g. gpiozero's device) are ignored"""
+        # Debounce here rather than sleeping, a held key repeats its press events
+        now = time.monotonic()
+        if now - self.last_press.get(button_name, float("-inf")) < self.debounce_interval:
             return
-            
-        while self.running:
-            try:
-                for key, button in self.key_mapping.items():
-                    if keyboard.is_pressed(key):
-                        self._button_callback(button)
-                        # Sleep to avoid multiple triggers from a single press
-                        time.sleep(0.3)
-                
-                # Short sleep to reduce CPU usage
-                time.sleep(0.05)
-            except Exception as e:
-                print(f"Error in keyboard monitor: {e}")
-                time.sleep(0.5)
-    
-    def _button_callback(self, button_name):
-        """Handle button press events"""
-        print(f"Button pressed: {button_name}")
+        self.last_press[button_name] = now
+        
+        log.debug("Button pressed: %s", button_name)
         
         # Call all registered callbacks for this button
-        for callback in self.callbacks.get(button_name, []):
+        for callback in self.callbacks.get(button_name, ()):
             try:
                 callback()
             except Exception as e:
@@ -144,18 +214,22 @@ class InputHandler:
         button_name: 'button1', 'button2', or 'button3'
         callback: function to call when the button is pressed
         """
-        if button_name not in self.callbacks:
-            self.callbacks[button_name] = []
-            
-        self.callbacks[button_name].append(callback)
+        self.callbacks[button_name] = self.callbacks.get(button_name, ()) + (callback,)
     
     def cleanup(self):
         """Clean up resources"""
+        # Remove keyboard hooks
+        if KEYBOARD_AVAILABLE and not IS_MACOS:
+            try:
+                keyboard.unhook_all()
+            except Exception as e:
+                print(f"Error removing keyboard hooks: {e}")
+                
+        # Stop the terminal reader and restore the terminal
         self.running = False
-        
-        # Stop keyboard thread
-        if self.keyboard_thread and self.keyboard_thread.is_alive():
-            self.keyboard_thread.join(timeout=1.0)
+        if self.stdin_thread and self.stdin_thread.is_alive():
+            self.stdin_thread.join(timeout=1.0)
+        self._restore_tty()
             
         # Clean up GPIO resources
         for button in self.buttons.values():
@@ -1,24 +1,48 @@
 import os
+import logging
 import sys
 import time
 import tkinter as tk
 import threading
 import signal
+import queue
+import weakref
+from functools import partial
 from dotenv import load_dotenv
 
 # Load custom modules
 from gui_adapter import GUI, GUI1, GUI2
 from input_handler import InputHandler
-from transcriber import VoiceProcessor
+from transcriber import VoiceProcessor, LANGUAGE_CODES
 
 # Load environment variables
 load_dotenv()
 
+# Shared with transcriber and input_handler, set to logging.DEBUG to trace
+# every live transcription update and button press
+log = logging.getLogger("vrapp")
+log.setLevel(logging.INFO)
+
+
+def _weak_callback(method):
+    """Wrap a bound method so callers don't keep its object alive, calls become no-ops once it's gone"""
+    ref = weakref.WeakMethod(method)
+    
+    def callback(*args):
+        target = ref()
+        if target is not None:
+            target(*args)
+    return callback
+
+
 class TranslationApp:
     """
     Main controller for the voice translation application
     Acts as a state machine to manage scenes, recording, and translation
     """
+    # English and Russian always translate into each other
+    TRANSLATION_TARGETS = {"en": "ru", "ru": "en"}
+    
     def __init__(self):
         # Initialize the root window
         self.root = tk.Tk()
@@ -33,8 +57,24 @@ class TranslationApp:
         self.root.bind("<Escape>", self.exit_app)
         self.root.bind("<Control-c>", self.exit_app)
         
+        # Closing the window or quitting from the macOS app menu exits cleanly too
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
+        self.root.createcommand("::tk::mac::Quit", self.exit_app)
+        
+        # Ctrl+C in the terminal, installed once here rather than on every run().
+        # Python only runs the handler between bytecodes, the periodic _pump_ui
+        # callback makes sure that happens while Tk waits for events
+        signal.signal(signal.SIGINT, lambda sig, frame: self.exit_app())
+        
+        # Window size and the layout derived from it, kept current by <Configure>
+        # instead of being queried with winfo_* on every update
+        self._update_layout(720, 1080)
+        self.root.bind("<Configure>", self._on_resize)
+        self._camera_backdrop_cache = None  # ((width, height), PhotoImage) of the camera screen
+        
         # Initialize state variables
         self.current_scene_index = 0
+        self.current_scene = None
         self.is_recording = False
         self.is_processing = False
         self.is_showing_results = False
@@ -44,16 +84,26 @@ class TranslationApp:
         self.last_translation = ""
         self.detected_language = ""
         
+        # Live results from the processing thread, drawn by _pump_ui on the Tk thread
+        self.ui_queue = queue.Queue(maxsize=2)
+        self.input_events = queue.SimpleQueue()  # Button handlers waiting to run on the Tk thread
+        self.ui_pump_interval = 33  # ms between queue checks, this also paces redraws
+        self._last_rendered = None  # (display text, language) currently on screen
+        self.ui_render_interval = 0.2  # Seconds between redraws, partials in between are coalesced
+        self._pending_update = None  # Newest result not drawn yet
+        self._last_render_time = 0.0
+        self._last_display_text = None  # Text of the live transcription item
+        
         # Add cooldown system to prevent accidental re-entry
         self.last_action_time = 0
         self.cooldown_period = 1.0  # 1 second cooldown between state transitions
         
         # Initialize language settings - all use auto-detection now
-        self.language_settings = [
-            {"name": "Scene 1", "code": None, "target": "en"},  # GUI (Auto-detect to English)
-            {"name": "Scene 2", "code": None, "target": "ru"},  # GUI1 (Auto-detect to Russian)
-            {"name": "Scene 3", "code": None, "target": "en"}   # GUI2 (Auto-detect to English)
-        ]
+        # One tuple per field, indexed by scene: GUI (Auto-detect to English),
+        # GUI1 (Auto-detect to Russian), GUI2 (Auto-detect to English)
+        self._scene_names = ("Scene 1", "Scene 2", "Scene 3")
+        self._src_codes = (None, None, None)
+        self._tgt_codes = ("en", "ru", "en")
         
         # Initialize scenes using the adapter classes
         self.scenes = [
@@ -62,10 +112,8 @@ class TranslationApp:
             GUI2(self.root)      # Scene 3 (Video Record)
         ]
         
-        # Pre-load all scenes to prevent flickering
-        for scene in self.scenes:
-            scene.setup()  # Initialize each scene
-            scene.hide()   # But hide them initially
+        # Only the first scene is built now, the others are drawn by their first show()
+        self.scenes[0].setup()
         
         # Initialize voice processor
         self.voice_processor = VoiceProcessor()
@@ -80,26 +128,89 @@ class TranslationApp:
         # Start with the first scene (gui.py)
         self.load_current_scene()
         
+        # Start draining button presses and live results on the Tk thread
+        self.root.after(self.ui_pump_interval, self._pump_ui)
+        
+    def _on_resize(self, event):
+        """Refresh the cached layout when the window size changes"""
+        # Bindings on the root also fire for every child widget
+        if event.widget is self.root:
+            self._update_layout(event.width, event.height)
+    
+    def _update_layout(self, width, height):
+        """Precompute the screen-relative positions and sizes used while drawing"""
+        self._sw = width
+        self._sh = height
+        # Live transcription sits below the image with a large font
+        self._text_y = int(height * 0.7)  # About 70% from the top
+        self._font_size = int(height * 0.08)  # 8% of screen height
+    
+    def _camera_shapes(self):
+        """Boxes and recording dot of the camera screen as (kind, coords, fill, outline, width)"""
+        screen_width, screen_height = self._sw, self._sh
+        title_y = int(screen_height * 0.55)  # Title at 55% from top (below image)
+        status_y = int(screen_height * 0.7)  # Status at 70% from top
+        title_pad = int(screen_height * 0.12) * 0.8  # Box reaches above and below the text
+        status_pad = int(screen_height * 0.15) * 0.8
+        
+        # Recording indicator dot at 85% from top, centered horizontally
+        dot_radius = int(min(screen_width, screen_height) * 0.03)  # 3% of smaller dimension
+        dot_x, dot_y = screen_width / 2, int(screen_height * 0.85)
+        
+        return (
+            # Dark gray boxes with thick yellow and red outlines behind the two labels
+            ("rectangle", (screen_width * 0.1, title_y - title_pad, screen_width * 0.9, title_y + title_pad),
+             "#333333", "#FFFF00", 3),
+            ("rectangle", (screen_width * 0.1, status_y - status_pad, screen_width * 0.9, status_y + status_pad),
+             "#333333", "#FF0000", 3),
+            ("oval", (dot_x - dot_radius, dot_y - dot_radius, dot_x + dot_radius, dot_y + dot_radius),
+             "#FF0000", "", 0),
+        )
+    
+    def _camera_backdrop(self):
+        """Camera screen background and shapes rendered once into a PhotoImage, None without PIL"""
+        size = (self._sw, self._sh)
+        if self._camera_backdrop_cache is not None and self._camera_backdrop_cache[0] == size:
+            return self._camera_backdrop_cache[1]
+        try:
+            from PIL import Image, ImageDraw, ImageTk
+        except ImportError:
+            return None
+        
+        image = Image.new("RGB", size, "#000000")
+        draw = ImageDraw.Draw(image)
+        for kind, coords, fill, outline, width in self._camera_shapes():
+            # Tk calls an ellipse an oval
+            shape = draw.rectangle if kind == "rectangle" else draw.ellipse
+            shape(coords, fill=fill, outline=outline or None, width=width)
+        
+        # Kept on self so Tk doesn't lose the image while it's drawn
+        self._camera_backdrop_cache = (size, ImageTk.PhotoImage(image, master=self.root))
+        return self._camera_backdrop_cache[1]
+    
     def setup_button_handlers(self):
         """Set up callbacks for button inputs"""
-        self.input_handler.register_callback('button1', self.switch_scene)
-        self.input_handler.register_callback('button3', self.handle_scene_action)
+        # GPIO, keyboard hooks and the terminal reader fire on their own threads,
+        # so they only queue the handler and _pump_ui runs it on the Tk thread
+        self.input_handler.register_callback('button1', partial(self.input_events.put, self.switch_scene))
+        self.input_handler.register_callback('button3', partial(self.input_events.put, self.handle_scene_action))
     
     def load_current_scene(self):
         """Load the current scene based on the scene index"""
-        # Hide all scenes first
-        for scene in self.scenes:
-            scene.hide()
-        
+        self._enter_scene(self.current_scene_index)
+    
+    def _enter_scene(self, index):
+        """Stop whatever the current scene is doing and show the scene at index"""
         # Reset state BEFORE showing the new scene
-        self.is_showing_results = False
-        self.is_recording = False
-        self.is_processing = False
-        self.is_scene_active = False
-        self.live_transcription_active = False
+        self.reset_state()
+        
+        # Hide the scene being left, the others are already hidden
+        if self.current_scene is not None and self.current_scene is not self.scenes[index]:
+            self.current_scene.hide()
         
         # Set and show the current scene
-        self.current_scene = self.scenes[self.current_scene_index]
+        self.current_scene_index = index
+        self.current_scene = self.scenes[index]
         self.current_scene.show()
         
         # Update the window immediately to prevent flickering
@@ -119,24 +230,10 @@ class TranslationApp:
             print(f"Ignoring scene switch while in active feature. Use Button 3 to exit first.")
             return
         
-        # First, stop any active processes in the current scene
-        self.reset_state()
-        # Hide current scene first (smoother transition)
-        self.current_scene.hide()
-        # Move to the next scene
-        self.current_scene_index = (self.current_scene_index + 1) % len(self.scenes)
-        print(f"Switching to Scene {self.current_scene_index + 1} - {self.language_settings[self.current_scene_index]['name']}")
-        # Reset state BEFORE showing the new scene
-        self.is_showing_results = False
-        self.is_recording = False
-        self.is_processing = False
-        self.is_scene_active = False
-        self.live_transcription_active = False
-        # Show the new scene
-        self.current_scene = self.scenes[self.current_scene_index]
-        self.current_scene.show()
-        # Update immediately
-        self.root.update_idletasks()
+        # Move to the next scene, stopping any active processes in the current one
+        next_index = (self.current_scene_index + 1) % len(self.scenes)
+        print(f"Switching to Scene {next_index + 1} - {self._scene_names[next_index]}")
+        self._enter_scene(next_index)
         
         # Update last action time
         self.last_action_time = current_time
@@ -181,21 +278,9 @@ class TranslationApp:
             # Kill any running threads or processes
             self.stop_current_processes()
             
-            # COMPLETELY RELOAD THE SCENE FROM SCRATCH
-            # This ensures we go back to the proper initial state
-            print(f"Reloading scene {self.current_scene_index + 1} from scratch")
-            
-            # First hide the current scene
-            self.current_scene.hide()
-            
-            # Completely recreate the scene object to ensure a fresh state
-            scene_index = self.current_scene_index
-            scene_classes = [GUI, GUI1, GUI2]
-            self.scenes[scene_index] = scene_classes[scene_index](self.root)
-            self.current_scene = self.scenes[scene_index]
-            
-            # Set up and show the fresh scene
-            self.current_scene.setup()
+            # Put the scene back to its initial state, reusing the canvas and image
+            print(f"Resetting scene {self.current_scene_index + 1}")
+            self.current_scene.reset()
             self.current_scene.show()
             
             # Force update the UI
@@ -225,77 +310,33 @@ class TranslationApp:
                 # Show camera started message
                 self.current_scene.clear() 
                 
-                # Get screen dimensions
-                screen_width = self.root.winfo_width() or 720
-                screen_height = self.root.winfo_height() or 1080
-                center_x = screen_width / 2
-                center_y = screen_height / 2
-                
-                # Create a black background to ensure visibility
-                self.current_scene.canvas.create_rectangle(
-                    0, 0, screen_width, screen_height, 
-                    fill="#000000", outline=""
-                )
-                
-                # Calculate the image position (assuming it's at the top 40% of the screen)
-                image_center_y = screen_height * 0.3  # Image is at about 30% from the top
-                
-                # Position text BELOW the image
-                title_y = int(screen_height * 0.55)  # Title at 55% from top (below image)
-                status_y = int(screen_height * 0.7)  # Status at 70% from top
-                dot_y = int(screen_height * 0.85)  # Dot at 85% from top
-                
-                # Add a visual indicator box for the title text
-                self.current_scene.canvas.create_rectangle(
-                    screen_width * 0.1,  # 10% from left
-                    title_y - (int(screen_height * 0.12) * 0.8),  # Above text
-                    screen_width * 0.9,  # 90% from left
-                    title_y + (int(screen_height * 0.12) * 0.8),  # Below text
-                    fill="#333333",  # Dark gray background
-                    outline="#FFFF00",  # Yellow outline
-                    width=3  # Thick outline
-                )
+                # Background, boxes and dot come pre-rendered as one image item
+                backdrop = self._camera_backdrop()
+                if backdrop is not None:
+                    self.current_scene.canvas.create_image(0, 0, anchor="nw", image=backdrop)
+                else:
+                    # Without PIL draw the same shapes as separate canvas items,
+                    # the canvas's own black background shows between them
+                    for kind, coords, fill, outline, width in self._camera_shapes():
+                        create = getattr(self.current_scene.canvas, f"create_{kind}")
+                        create(*coords, fill=fill, outline=outline, width=width)
                 
                 # Add a title below the image with much larger text
                 self.current_scene.center_text(
                     "CAMERA MODE", 
-                    title_y, 
-                    font_size=int(screen_height * 0.12),  # 12% of screen height (much larger)
+                    int(self._sh * 0.55),  # Title at 55% from top (below image)
+                    font_size=int(self._sh * 0.12),  # 12% of screen height (much larger)
                     fill="#FFFF00"  # Bright yellow for better visibility
                 )
                 
-                # Add a visual indicator box for the status text
-                self.current_scene.canvas.create_rectangle(
-                    screen_width * 0.1,  # 10% from left
-                    status_y - (int(screen_height * 0.15) * 0.8),  # Above text
-                    screen_width * 0.9,  # 90% from left
-                    status_y + (int(screen_height * 0.15) * 0.8),  # Below text
-                    fill="#333333",  # Dark gray background
-                    outline="#FF0000",  # Red outline
-                    width=3  # Thick outline
-                )
-                
                 # Add the recording status below the title with very large font and bright red color
                 self.current_scene.center_text(
                     "RECORDING", 
-                    status_y, 
-                    font_size=int(screen_height * 0.15),  # 15% of screen height (very large)
+                    int(self._sh * 0.7),  # Status at 70% from top
+                    font_size=int(self._sh * 0.15),  # 15% of screen height (very large)
                     fill="#FF0000"  # Bright red
                 )
                 
-                # Add a recording indicator dot at the bottom
-                dot_radius = int(min(screen_width, screen_height) * 0.03)  # 3% of smaller dimension
-                dot_x = center_x  # Center horizontally
-                
-                self.current_scene.canvas.create_oval(
-                    dot_x - dot_radius, dot_y - dot_radius,
-                    dot_x + dot_radius, dot_y + dot_radius,
-                    fill="#FF0000", outline=""
-                )
-                
-                # Force immediate update
-                self.root.update()
-                
                 # Placeholder for actual camera functionality
                 # You'd typically initialize the camera here and start a video stream
                 # For now, we're just showing a message
@@ -312,13 +353,12 @@ class TranslationApp:
             return
             
         # Get the current language settings
-        current_language = self.language_settings[self.current_scene_index]
-        source_lang = current_language["code"]  # This will be None for auto-detection
-        target_lang = current_language["target"]
+        source_lang = self._src_codes[self.current_scene_index]  # This will be None for auto-detection
+        # Only the translation scene shows translations, the others don't need one
+        target_lang = self._tgt_codes[self.current_scene_index] if self.current_scene_index == 1 else None
         
         # Prepare the UI for live transcription
         self.current_scene.clear()
-        self.current_scene.canvas.create_rectangle(0, 0, 720, 1080, fill="#000000", outline="")
         
         # Add a header - store the ID to update it later
         header_title = " " if self.current_scene_index == 1 else " "
@@ -332,128 +372,135 @@ class TranslationApp:
         
         # This will hold the transcription text
         self.live_transcription_text_id = None
+        self._last_display_text = None
+        
+        # Drop any results left over from the previous session
+        self._last_rendered = None
+        self._pending_update = None
+        try:
+            while True:
+                self.ui_queue.get_nowait()
+        except queue.Empty:
+            pass
         
         # Start live transcription
         self.live_transcription_active = True
         self.voice_processor.start_live_transcription(
             source_lang=source_lang,
             target_lang=target_lang,
-            callback=self.update_live_transcription
+            # The processing thread only holds a weak reference to the app
+            callback=_weak_callback(self.update_live_transcription)
         )
         
         # Update UI immediately
         self.root.update_idletasks()
     
     def update_live_transcription(self, transcription, translation, detected_lang):
-        """Callback for updating the live transcription UI"""
+        """Callback for live transcription results, queues them for the Tk thread"""
+        item = (transcription, translation, detected_lang)
+        try:
+            self.ui_queue.put_nowait(item)
+        except queue.Full:
+            # Drop the oldest result, only the newest one is worth drawing
+            try:
+                self.ui_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.ui_queue.put_nowait(item)
+            except queue.Full:
+                pass
+    
+    def _pump_ui(self):
+        """Run queued button handlers and draw the newest live result, runs on the Tk thread"""
+        try:
+            while True:
+                handler = self.input_events.get_nowait()
+                try:
+                    handler()
+                except Exception as e:
+                    print(f"Error in button handler: {e}")
+        except queue.Empty:
+            pass
+        
+        item = None
+        try:
+            while True:
+                item = self.ui_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if item is not None:
+            self._pending_update = item
+        
+        # Draw at most every ui_render_interval, only the newest result is kept
+        now = time.monotonic()
+        if self._pending_update is not None and now - self._last_render_time >= self.ui_render_interval:
+            item, self._pending_update = self._pending_update, None
+            self._last_render_time = now
+            self._render_live_transcription(*item)
+        self.root.after(self.ui_pump_interval, self._pump_ui)
+    
+    def _render_live_transcription(self, transcription, translation, detected_lang):
+        """Update the live transcription UI with one result"""
         if not self.live_transcription_active:
             return
             
         try:
-            # Update detected language text
-            display_language = detected_lang.capitalize() if detected_lang else "Detecting..."
-            self.current_scene.canvas.itemconfig(
-                self.detected_language_text_id,
-                text=f"Detected: {display_language}"
-            )
-            
-            # Clear previous text
-            if self.live_transcription_text_id:
-                self.current_scene.canvas.delete(self.live_transcription_text_id)
-            
             # Determine what text to display based on the scene
             if self.current_scene_index == 1:  # Scene 2 (Translation)
-                # For translation scene, show only the translated text (Russian)
-                # Need to translate if not already done
-                if transcription and (translation is None or translation == ""):
-                    print(f"Need to translate: '{transcription}'")
-                    # Always attempt to translate to Russian regardless of detected language
-                    try:
-                        # Get target language (Russian)
-                        target_lang = self.language_settings[self.current_scene_index]["target"]
-                        source_lang = "en"  # Default to English if we can't detect
-                        
-                        # If we have a detected language, use it
-                        if detected_lang:
-                            if "english" in detected_lang.lower() or "en" == detected_lang.lower():
-                                source_lang = "en"
-                            elif "russian" in detected_lang.lower() or "ru" == detected_lang.lower():
-                                source_lang = "ru"
-                            elif "korean" in detected_lang.lower() or "ko" == detected_lang.lower():
-                                source_lang = "ko"
-                            # Add more language detections as needed
-                        
-                        print(f"Translating from {source_lang} to {target_lang}...")
-                        translation = self.voice_processor.translator.translate(
-                            transcription, source_lang, target_lang
-                        )
-                        print(f"Translated to Russian: {translation}")
-                    except Exception as e:
-                        print(f"Translation error: {e}")
-                        translation = "Translation error"
-                
-                # Display the translation or waiting message
+                # For translation scene, show only the translated text (Russian),
+                # VoiceProcessor already translated it on its own thread
                 display_text = translation or "Waiting for speech to translate..."
                 display_title = "Russian Translation"
             else:
                 # For other scenes, show the transcription
                 display_text = transcription or "Listening..."
                 display_title = "Transcription"
-                
-            # Update the header to indicate what's being shown
-            self.current_scene.canvas.itemconfig(
-                self.header_text_id,
-                text=display_title
-            )
-            
-            # Get screen dimensions for adaptive sizing
-            screen_width = self.root.winfo_width() or 720
-            screen_height = self.root.winfo_height() or 1080
-            
-            # Make sure we have a black background for better visibility
-            self.current_scene.canvas.create_rectangle(
-                0, 0, screen_width, screen_height,
-                fill="#000000", outline=""
-            )
-            
-            # Calculate the position of the image (it's at the center of the screen)
-            image_center_x = screen_width / 2
-            image_center_y = screen_height * 0.4  # Image is at about 40% from the top
             
-            # Position text BELOW the image (at about 70% from the top)
-            text_position_y = int(screen_height * 0.7)  # Position text below the image
+            # Nothing on screen would change, skip the redraw entirely
+            if (display_text, detected_lang) == self._last_rendered:
+                return
+            self._last_rendered = (display_text, detected_lang)
             
-            # Use much larger font size for better visibility
-            adaptive_font_size = int(screen_height * 0.08)  # 8% of screen height (much larger)
-            adaptive_width = int(screen_width * 0.9)  # 90% of screen width
+            # Looked up once here instead of through the attribute chain per call,
+            # set_text mirrors the labels the same way center_text drew them
+            scene = self.current_scene
+            set_text = scene.set_text
             
-            # Format text with one word per line for better readability on VR display
-            # Split the text into words and join with newlines
-            words = display_text.split()
-            formatted_text = "\n".join(words)
-            
-            # Display text with much larger font and white color
-            self.live_transcription_text_id = self.current_scene.center_text(
-                text=formatted_text,
-                y=text_position_y - 100,  # Position higher to accommodate multiple lines
-                font_size=adaptive_font_size,
-                fill="#FFFFFF",  # White text for better visibility
-                width=None  # No width constraint since we're manually formatting
-            )
+            # Update detected language text
+            display_language = detected_lang.capitalize() if detected_lang else "Detecting..."
+            set_text(self.detected_language_text_id, f"Detected: {display_language}")
             
-            # Force a complete redraw
-            self.root.update()
+            # Update the header to indicate what's being shown
+            set_text(self.header_text_id, display_title)
             
-            # Print confirmation that text is being displayed
-            print(f"Displaying text on screen: {display_text[:50]}...")
+            # The canvas background is already black, and the position and font
+            # size come from the cached layout
             
-            # Force a complete redraw of the window
-            try:
-                self.root.update()
-            except Exception as e:
-                print(f"Error updating window: {e}")
-            
-            # Update the window
+            # Only a change of text needs reformatting, a new language alone doesn't
+            if display_text != self._last_display_text:
+                self._last_display_text = display_text
+                
+                # Format text with one word per line for better readability on VR display
+                # Split the text into words and join with newlines
+                formatted_text = "\n".join(display_text.split())
+                
+                if self.live_transcription_text_id is None:
+                    # Display text with much larger font and white color
+                    self.live_transcription_text_id = scene.center_text(
+                        text=formatted_text,
+                        y=self._text_y - 100,  # Position higher to accommodate multiple lines
+                        font_size=self._font_size,
+                        fill="#FFFFFF",  # White text for better visibility
+                        width=None  # No width constraint since we're manually formatting
+                    )
+                else:
+                    # Reuse the item rather than deleting and recreating it
+                    set_text(self.live_transcription_text_id, formatted_text)
+            
+            log.debug("Displaying text on screen: %.50s...", display_text)
+            
+            # Redraw once, without re-entering the event loop
             self.root.update_idletasks()
             
         except Exception as e:
@@ -495,7 +542,6 @@ class TranslationApp:
             return
             
         self.current_scene.clear()
-        self.current_scene.canvas.create_rectangle(0, 0, 720, 1080, fill="#000000", outline="")
         self.current_scene.center_text("Recording...", 500, font_size=50)
         self.root.update_idletasks()
     
@@ -509,9 +555,6 @@ class TranslationApp:
         # Clear the canvas
         self.current_scene.clear()
         
-        # Draw black background
-        self.current_scene.canvas.create_rectangle(0, 0, 720, 1080, fill="#000000", outline="")
-        
         # Use detected language for display
         display_language = self.detected_language.capitalize() if self.detected_language else "Auto-detected"
         
@@ -532,17 +575,14 @@ class TranslationApp:
             
             # Get the actual target language - in cases where source language matches target,
             # the VoiceProcessor might have switched targets (like EN -> RU instead of EN -> EN)
-            source_language = self.detected_language.lower() if self.detected_language else "unknown"
-            target_language = "English" 
+            source_code = LANGUAGE_CODES.get(self.detected_language.lower()) if self.detected_language else None
             
-            # Set display name based on the source language (since target might have been switched)
-            if source_language in ["english", "en"]:
-                target_language = "Russian"
-            elif source_language in ["russian", "ru"]:
-                target_language = "English"
-            else:
-                # For other languages, use the configured target
-                target_language = "English" if self.language_settings[self.current_scene_index]["target"] == "en" else "Russian"
+            # Set display name based on the source language (since target might have been switched),
+            # for other languages use the configured target
+            target_code = self.TRANSLATION_TARGETS.get(
+                source_code, self._tgt_codes[self.current_scene_index]
+            )
+            target_language = "English" if target_code == "en" else "Russian"
                 
             self.current_scene.center_text(
                 f"Translation ({target_language})", 
@@ -561,26 +601,38 @@ class TranslationApp:
         if not text:
             return
             
-        # Simple word wrapping
-        lines = []
-        current_line = ""
-        max_chars = 40  # Adjust based on font size
-        
-        for word in text.split():
-            if len(current_line + " " + word) <= max_chars:
-                current_line += " " + word if current_line else word
-            else:
-                lines.append(current_line)
-                current_line = word
-                
-        if current_line:
-            lines.append(current_line)
-            
-        # Display lines centered
-        y_pos = start_y
-        for line in lines:
-            self.current_scene.center_text(line, y_pos, font_size=24)
-            y_pos += 40  # Increased from 30 to 40 for better spacing
+        max_chars = self.current_scene.line_chars(font_size=24)  # Fits the wrap width at this font size
+        
+        if self.current_scene.mirrored:
+            # Mirrored lines have to be split here so each one can be reversed on
+            # its own, words are collected per line and joined once
+            lines = []
+            line_words = []
+            line_len = -1  # No space before the first word
+            
+            for word in text.split():
+                if line_words and line_len + 1 + len(word) > max_chars:
+                    lines.append(" ".join(line_words))
+                    line_words = []
+                    line_len = -1
+                line_words.append(word)
+                line_len += 1 + len(word)
+                    
+            if line_words:
+                lines.append(" ".join(line_words))
+            block = "\n".join(lines)
+            line_count = len(lines)
+        else:
+            # Tk wraps the item at center_text's pixel width in C, so only the
+            # line count is estimated here to place the block
+            block = " ".join(text.split())
+            line_count = max(1, -(-len(block) // max_chars))
+            
+        # All lines go into one multi-line item instead of one item per line,
+        # centered on the block so the first line still sits at start_y
+        line_height = 40  # Increased from 30 to 40 for better spacing
+        center_y = start_y + (line_count - 1) * line_height / 2
+        self.current_scene.center_text(block, center_y, font_size=24)
     
     def show_error(self, error_msg):
         """Show an error message"""
@@ -588,7 +640,6 @@ class TranslationApp:
             return
             
         self.current_scene.clear()
-        self.current_scene.canvas.create_rectangle(0, 0, 720, 1080, fill="#000000", outline="")
         self.current_scene.center_text("Error", 400, font_size=50, fill="#FFFFFF")
         self.current_scene.center_text(error_msg, 500, font_size=30)
         self.is_showing_results = True
@@ -609,9 +660,6 @@ class TranslationApp:
     
     def run(self):
         """Run the application main loop"""
-        # Set up signal handlers for clean exit
-        signal.signal(signal.SIGINT, lambda sig, frame: self.exit_app())
-        
         # Start the main loop
         try:
             self.root.mainloop()
@@ -620,5 +668,7 @@ class TranslationApp:
 
 
 if __name__ == "__main__":
+    # Without a handler only warnings would reach the terminal
+    logging.basicConfig(format="%(message)s")
     app = TranslationApp()
     app.run()
\ No newline at end of file
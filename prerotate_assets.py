@@ -0,0 +1,45 @@
+"""
+Build step: write the scene images as PPMs Tk can load directly
+
+For each scene image drawn on its own this writes image_1_rot.ppm, rotated for
+the VR layout, flattened onto the canvas's black background and fit to the
+canvas. Pass --unrotated to also write image_1.ppm for the upright layout.
+The app loads them with a plain PhotoImage, so it never has to import PIL,
+rotate or decode images at startup. The PPMs are build output and are not
+committed; an image_1.png newer than its PPM is loaded through PIL until
+this is run again.
+"""
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+from gui_adapter import GUI, GUI1, GUI2, fit_canvas
+
+ASSETS = Path(__file__).parent / "assets"
+
+
+def main():
+    orientations = (True, False) if "--unrotated" in sys.argv[1:] else (True,)
+    for scene in (GUI, GUI1, GUI2):
+        spec = scene.SPEC
+        if spec.rect:
+            # Composited behind its rectangle at load time, so a PPM is never read
+            continue
+        path = ASSETS / spec.assets / "image_1.png"
+        with Image.open(path) as image:
+            # PPM has no alpha, so flatten onto the canvas's black background
+            rgba = image.convert("RGBA")
+            flat = Image.new("RGB", rgba.size, (0, 0, 0))
+            flat.paste(rgba, mask=rgba.getchannel("A"))
+
+        for rotated in orientations:
+            out = path.with_name(path.stem + ("_rot" if rotated else "") + ".ppm")
+            # Rotate 90 degrees left for the rotated VR layout
+            oriented = flat.transpose(Image.ROTATE_90) if rotated else flat
+            fit_canvas(oriented, rotated).save(out, format="PPM")
+            print(f"Wrote {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import io
 import os
 import time
 import tempfile
@@ -6,11 +7,50 @@ import wave
 import pyaudio
 import openai
 import json
+import re
+import logging
+from contextlib import nullcontext
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Per-chunk progress goes to this logger at DEBUG level, so it costs nothing
+# unless someone turns it on
+log = logging.getLogger("vrapp")
+
+# Language names the API reports, mapped to the codes used for translation.
+# Codes map to themselves so either form can be looked up directly.
+LANGUAGE_CODES = {
+    "english": "en",
+    "russian": "ru",
+    "spanish": "es",
+    "french": "fr",
+    "german": "de",
+    "japanese": "ja",
+    "italian": "it",
+    "chinese": "zh",
+    "korean": "ko"
+}
+LANGUAGE_CODES.update({code: code for code in list(LANGUAGE_CODES.values())})
+
+# Scripts that identify a language on their own, searched by the regex engine
+# instead of checking characters one by one in Python
+_CYRILLIC_RE = re.compile(r"[\u0400-\u04FF]")
+_KANA_RE = re.compile(r"[\u3040-\u30ff]")  # Only Japanese writes kana
+_HAN_RE = re.compile(r"[\u4e00-\u9fff]")  # Han with no kana is taken as Chinese
+
+
+def _script_language(text):
+    """Guess the language name of a transcription from its script, "auto-detected" if nothing stands out"""
+    if _CYRILLIC_RE.search(text):
+        return "russian"
+    if _KANA_RE.search(text):
+        return "japanese"
+    if _HAN_RE.search(text):
+        return "chinese"
+    return "auto-detected"
+
 class AudioRecorder:
     """
     Records audio from the microphone
@@ -86,24 +126,44 @@ class AudioRecorder:
         self.recording_thread.daemon = True
         self.recording_thread.start()
         
+    def _open_stream(self):
+        """Open the input stream on the selected device"""
+        # Open the audio stream with the selected input device if available
+        kwargs = {
+            'format': self.format,
+            'channels': self.channels,
+            'rate': self.rate,
+            'input': True,
+            'frames_per_buffer': self.chunk
+        }
+        
+        # Add input device index if available
+        if hasattr(self, 'input_device_index') and self.input_device_index is not None:
+            kwargs['input_device_index'] = self.input_device_index
+            
+        stream = self.audio.open(**kwargs)
+        print(f"Audio stream opened successfully with rate={self.rate}, channels={self.channels}")
+        return stream
+        
     def _record(self):
         """Record audio in a separate thread"""
+        # The stream is opened once and only paused between recordings,
+        # reopening PortAudio costs noticeable latency on every start
+        if self.stream is not None:
+            try:
+                self.stream.start_stream()
+            except Exception as e:
+                print(f"Error restarting audio stream: {e}")
+                # The stream may already be closed, don't let that mask the error above
+                try:
+                    self.stream.close()
+                except Exception:
+                    pass
+                self.stream = None
+        
         try:
-            # Open the audio stream with the selected input device if available
-            kwargs = {
-                'format': self.format,
-                'channels': self.channels,
-                'rate': self.rate,
-                'input': True,
-                'frames_per_buffer': self.chunk
-            }
-            
-            # Add input device index if available
-            if hasattr(self, 'input_device_index') and self.input_device_index is not None:
-                kwargs['input_device_index'] = self.input_device_index
-                
-            self.stream = self.audio.open(**kwargs)
-            print(f"Audio stream opened successfully with rate={self.rate}, channels={self.channels}")
+            if self.stream is None:
+                self.stream = self._open_stream()
         except Exception as e:
             print(f"Error opening audio stream: {e}")
             self.is_recording = False
@@ -127,7 +187,7 @@ class AudioRecorder:
                             import numpy as np
                             audio_array = np.frombuffer(data, dtype=np.int16)
                             rms = np.sqrt(np.mean(np.square(audio_array)))
-                            print(f"Audio level: {rms:.2f}")
+                            log.debug("Audio level: %.2f", rms)
                         except ImportError:
                             pass
                     
@@ -158,7 +218,7 @@ class AudioRecorder:
                             import numpy as np
                             audio_array = np.frombuffer(data, dtype=np.int16)
                             rms = np.sqrt(np.mean(np.square(audio_array)))
-                            print(f"Audio level: {rms:.2f}")
+                            log.debug("Audio level: %.2f", rms)
                         except ImportError:
                             pass
                     
@@ -168,11 +228,9 @@ class AudioRecorder:
                     print(f"Error recording audio: {e}")
                     break
         
-        # Clean up
+        # Pause the stream, cleanup() closes it
         if self.stream:
             self.stream.stop_stream()
-            self.stream.close()
-            self.stream = None
     
     def stop_recording(self):
         """Stop recording audio"""
@@ -261,6 +319,7 @@ class AudioRecorder:
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+            self.stream = None
             
         self.audio.terminate()
 
@@ -282,6 +341,7 @@ class WhisperTranscriber:
     def transcribe(self, audio_file, language=None, max_retries=2):
         """
         Transcribe audio file using Whisper API
+        audio_file: path of a WAV file, or an in-memory WAV buffer with a .name
         language: optional language code (e.g., 'en', 'ru', 'ja')
         max_retries: number of retries if transcription fails
         
@@ -289,16 +349,22 @@ class WhisperTranscriber:
         """
         for attempt in range(max_retries + 1):
             try:
-                print(f"Transcription attempt {attempt+1}/{max_retries+1}")
-                print(f"Attempting to transcribe audio file: {audio_file}")
-                # Check if file exists
-                if not os.path.exists(audio_file):
-                    print(f"Error: Audio file not found: {audio_file}")
-                    return "", ""
-                
-                # Check file size
-                file_size = os.path.getsize(audio_file)
-                print(f"Audio file size: {file_size} bytes")
+                log.debug("Transcription attempt %d/%d", attempt + 1, max_retries + 1)
+                log.debug("Attempting to transcribe audio file: %s", audio_file)
+                in_memory = not isinstance(audio_file, (str, os.PathLike))
+                if in_memory:
+                    # Buffers are sent as they are, from the start on every attempt
+                    audio_file.seek(0)
+                    file_size = audio_file.getbuffer().nbytes
+                else:
+                    # Check if file exists
+                    if not os.path.exists(audio_file):
+                        print(f"Error: Audio file not found: {audio_file}")
+                        return "", ""
+                    
+                    # Check file size
+                    file_size = os.path.getsize(audio_file)
+                log.debug("Audio file size: %d bytes", file_size)
                 
                 if file_size == 0:
                     print("Error: Audio file is empty")
@@ -307,7 +373,7 @@ class WhisperTranscriber:
                     print("Warning: Audio file is very small, may not contain enough speech data")
                     
                 # Open the audio file
-                with open(audio_file, "rb") as file:
+                with nullcontext(audio_file) if in_memory else open(audio_file, "rb") as file:
                     # Call the Whisper API using the updated client format
                     options = {}
                     if language:
@@ -315,7 +381,7 @@ class WhisperTranscriber:
                     else:
                         # If no language specified, try to detect English
                         options["language"] = "en"
-                        print("No language specified, defaulting to English detection")
+                        log.debug("No language specified, defaulting to English detection")
                     
                     # Add additional options for better recognition
                     options["temperature"] = 0.2  # Slightly higher temperature for more flexibility
@@ -325,7 +391,7 @@ class WhisperTranscriber:
                         from openai import OpenAI
                         client = OpenAI(api_key=self.api_key)
                         
-                        print("Using new OpenAI client format with options:", options)
+                        log.debug("Using new OpenAI client format with options: %s", options)
                         response = client.audio.transcriptions.create(
                             model="whisper-1",
                             file=file,
@@ -334,7 +400,8 @@ class WhisperTranscriber:
                         
                         # Extract the transcription text
                         transcription = response.text
-                        detected_language = "auto-detected"  # New API doesn't return language
+                        # New API doesn't return language, so tell it from the text
+                        detected_language = _script_language(transcription) if transcription else "auto-detected"
                         
                     except (ImportError, AttributeError) as e:
                         print(f"Error with new client format: {e}, falling back to legacy format")
@@ -350,7 +417,7 @@ class WhisperTranscriber:
                         detected_language = response.get("language", "")
                     
                     if transcription:
-                        print(f"Transcription successful: '{transcription}'")
+                        log.debug("Transcription successful: '%s'", transcription)
                         return transcription, detected_language
                     else:
                         print("Transcription returned empty result")
@@ -384,6 +451,11 @@ class Translator:
         
         openai.api_key = self.api_key
         
+        # (text, source, target) -> translation, oldest entries are evicted first
+        self.cache_size = 1024
+        self._cache = {}
+        self._cache_lock = threading.Lock()  # Live and one-shot translations run on different threads
+        
     def translate(self, text, source_lang, target_lang):
         """
         Translate text from source language to target language
@@ -392,18 +464,32 @@ class Translator:
             print("No text to translate")
             return ""
             
+        # Repeated phrases are answered from the cache instead of another API round trip
+        key = (text, source_lang, target_lang)
+        translation = self._cache.get(key)
+        if translation is None:
+            translation = self._request_translation(text, source_lang, target_lang)
+            if translation:  # Failures return "" and are retried next time
+                with self._cache_lock:
+                    if len(self._cache) >= self.cache_size:
+                        del self._cache[next(iter(self._cache))]
+                    self._cache[key] = translation
+        return translation
+        
+    def _request_translation(self, text, source_lang, target_lang):
+        """Ask the API for one translation, "" on failure"""
         try:
             # Prepare the prompt for translation
             prompt = f"Translate the following {source_lang} text to {target_lang}:\n\n{text}\n\nTranslation:"
             
-            print(f"Translating from {source_lang} to {target_lang}...")
+            log.debug("Translating from %s to %s...", source_lang, target_lang)
             
             try:
                 # Try the new client format first
                 from openai import OpenAI
                 client = OpenAI(api_key=self.api_key)
                 
-                print("Using new OpenAI client format for translation")
+                log.debug("Using new OpenAI client format for translation")
                 response = client.chat.completions.create(
                     model="gpt-3.5-turbo",
                     messages=[
@@ -433,7 +519,7 @@ class Translator:
                 # Extract the translation
                 translation = response.choices[0].message.content.strip()
             
-            print(f"Translation successful: {translation[:50]}...")
+            log.debug("Translation successful: %.50s...", translation)
             return translation
             
         except Exception as e:
@@ -453,6 +539,16 @@ class VoiceProcessor:
         self.processing_thread = None
         self.should_process = False
         self.callback = None
+        self.silence_rms = 50  # Live chunks quieter than this are not sent to Whisper
+        
+    def _is_silent(self, audio_data):
+        """True if a chunk of 16-bit audio is too quiet to contain speech"""
+        try:
+            import numpy as np
+        except ImportError:
+            return False  # Without numpy every chunk is transcribed
+        samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+        return float(np.sqrt(np.mean(samples * samples))) < self.silence_rms
         
     def start_live_transcription(self, source_lang=None, target_lang=None, callback=None):
         """
@@ -507,14 +603,15 @@ class VoiceProcessor:
                         # Join the audio frames
                         audio_data = b''.join(frames_copy)
                         
-                        # Skip all the energy analysis and just process the audio directly
-                        # This makes it more responsive and simpler
+                        # Silence and room noise would cost a Whisper round trip for nothing
+                        if self._is_silent(audio_data):
+                            log.debug("Silent chunk, skipping")
+                            continue
                         
-                        # Create a temporary file for the audio
-                        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                            audio_file = temp_file.name
-                            
-                        # Save the audio data
+                        # Build the WAV in memory, the API only needs a file-like object
+                        # with a name to tell the format from
+                        audio_file = io.BytesIO()
+                        audio_file.name = "audio.wav"
                         with wave.open(audio_file, 'wb') as wf:
                             wf.setnchannels(self.recorder.channels)
                             wf.setsampwidth(self.recorder.audio.get_sample_size(self.recorder.format))
@@ -526,38 +623,25 @@ class VoiceProcessor:
                         
                         # Simple processing - just use the transcription directly
                         if not transcription.strip():
-                            print("Empty transcription, skipping")
+                            log.debug("Empty transcription, skipping")
                             continue
                         
                         # Skip if it's exactly the same as the last transcription
                         if transcription.strip() == last_transcription.strip():
-                            print(f"Duplicate transcription, skipping")
+                            log.debug("Duplicate transcription, skipping")
                             continue
                             
                         # Update last transcription
                         last_transcription = transcription.strip()
                         
                         if detected_lang:
-                            print(f"API detected language: {detected_lang}")
+                            log.debug("API detected language: %s", detected_lang)
                             
-                        # Map language names to codes for consistency
-                        language_code_map = {
-                            "english": "en",
-                            "russian": "ru",
-                            "spanish": "es",
-                            "french": "fr",
-                            "german": "de",
-                            "japanese": "ja",
-                            "italian": "it",
-                            "chinese": "zh",
-                            "korean": "ko"
-                        }
-                        
                         # Standardize language code
-                        if detected_lang and detected_lang.lower() in language_code_map:
-                            detected_lang_code = language_code_map[detected_lang.lower()]
+                        if detected_lang:
+                            detected_lang_code = LANGUAGE_CODES.get(detected_lang.lower(), detected_lang.lower())
                         else:
-                            detected_lang_code = detected_lang.lower() if detected_lang else None
+                            detected_lang_code = None
                         
                         # Determine source and target languages
                         actual_source_lang = source_lang or detected_lang_code or "en"
@@ -569,29 +653,32 @@ class VoiceProcessor:
                         if target_lang and transcription and detected_lang_code:
                             # Logic for Russian translation (target_lang = "ru")
                             if target_lang == "ru" and detected_lang_code == "en":
-                                print(f"Translating English to Russian...")
+                                log.debug("Translating English to Russian...")
                                 translation = self.translator.translate(transcription, "en", "ru")
                             
                             # Logic for English translation (target_lang = "en")
                             elif target_lang == "en" and detected_lang_code == "ru":
-                                print(f"Translating Russian to English...")
+                                log.debug("Translating Russian to English...")
                                 translation = self.translator.translate(transcription, "ru", "en")
                             
                             # Special case for other detected languages
                             elif detected_lang_code not in ["en", "ru"]:
                                 # Always translate other languages to the target
-                                print(f"Translating {detected_lang} to {target_lang}...")
+                                log.debug("Translating %s to %s...", detected_lang, target_lang)
                                 translation = self.translator.translate(transcription, detected_lang_code, target_lang)
-                        
-                        # Clean up temp file
-                        try:
-                            os.unlink(audio_file)
-                        except:
-                            pass
+                            
+                        # Cover the remaining cases here too, so the UI thread never translates
+                        if target_lang and transcription and translation is None:
+                            if detected_lang_code == target_lang:
+                                # Already in the target language
+                                translation = transcription
+                            else:
+                                log.debug("Translating to %s...", target_lang)
+                                translation = self.translator.translate(transcription, detected_lang_code or "en", target_lang)
                         
                         # Call the callback function with results
                         if self.callback:
-                            print(f"Displaying text on screen: {transcription}")
+                            log.debug("Displaying text on screen: %s", transcription)
                             self.callback(transcription, translation, detected_lang)
                             
                 except Exception as e: